@@ -4,6 +4,7 @@ from getpass import getpass
 from logging import Logger
 from os import PathLike
 from pathlib import Path
+from stat import S_ISDIR
 import sys
 import time
 
@@ -11,7 +12,7 @@ from dateutil.parser import parse as parse_date
 import humanize as humanize
 import numpy
 
-from packetraven.base import PacketSource
+from packetraven.base import PacketSource, TimeIntervalError
 from packetraven.connections import (
     APRSDatabaseTable,
     APRSfi,
@@ -20,7 +21,6 @@ from packetraven.connections import (
     PacketGeoJSON,
     RawAPRSTextFile,
     SerialTNC,
-    TimeIntervalError,
 )
 from packetraven.packets import APRSPacket
 from packetraven.predicts import PredictionAPIURL, PredictionError, get_predictions
@@ -33,6 +33,15 @@ LOGGER = get_logger('packetraven', log_format='%(asctime)s | %(message)s')
 CREDENTIALS_FILENAME = repository_root() / 'credentials.config'
 DEFAULT_INTERVAL_SECONDS = 20
 
+DATABASE_CREDENTIALS = (
+    'database_hostname',
+    'database_database',
+    'database_table',
+    'database_username',
+    'database_password',
+)
+SSH_TUNNEL_CREDENTIALS = ('ssh_hostname', 'ssh_username', 'ssh_password')
+
 
 def main():
     args_parser = ArgumentParser()
@@ -93,7 +102,11 @@ def main():
     using_igate = args.igate
 
     if args.callsigns is not None:
-        callsigns = [callsign.upper() for callsign in args.callsigns.strip('"').split(',')]
+        callsigns = [
+            callsign.strip().upper()
+            for callsign in args.callsigns.strip('"').split(',')
+            if not callsign.isspace() and len(callsign) > 0
+        ]
     else:
         callsigns = None
 
@@ -112,75 +125,50 @@ def main():
                 f'unable to parse hostname, database name, and table name from input "{database}"'
             )
         else:
-            (
-                kwargs['database_hostname'],
-                kwargs['database_database'],
-                kwargs['database_table'],
-            ) = database.split('/')
-            if '@' in kwargs['database_hostname']:
-                kwargs['database_username'], kwargs['database_hostname'] = kwargs[
-                    'database_hostname'
-                ].split('@', 1)
-                if ':' in kwargs['database_username']:
-                    kwargs['database_username'], kwargs['database_password'] = kwargs[
-                        'database_username'
-                    ].split(':', 1)
+            database_hostname, database_database, database_table = database.split('/')
+            if '@' in database_hostname:
+                database_username, database_hostname = database_hostname.split('@', 1)
+                if ':' in database_username:
+                    database_username, kwargs['database_password'] = database_username.split(
+                        ':', 1
+                    )
+                kwargs['database_username'] = database_username
+            kwargs['database_hostname'] = database_hostname
+            kwargs['database_database'] = database_database
+            kwargs['database_table'] = database_table
 
     if args.tunnel is not None:
-        kwargs['ssh_hostname'] = args.tunnel
-        if '@' in kwargs['ssh_hostname']:
-            kwargs['ssh_username'], kwargs['ssh_hostname'] = kwargs['ssh_hostname'].split(
-                '@', 1
-            )
-            if ':' in kwargs['ssh_username']:
-                kwargs['ssh_username'], kwargs['ssh_password'] = kwargs['ssh_username'].split(
-                    ':', 1
-                )
+        ssh_hostname = args.tunnel
+        if '@' in ssh_hostname:
+            ssh_username, ssh_hostname = ssh_hostname.split('@', 1)
+            if ':' in ssh_username:
+                ssh_username, kwargs['ssh_password'] = ssh_username.split(':', 1)
+            kwargs['ssh_username'] = ssh_username
+        kwargs['ssh_hostname'] = ssh_hostname
 
     start_date = parse_date(args.start.strip('"')) if args.start is not None else None
     end_date = parse_date(args.end.strip('"')) if args.end is not None else None
 
-    if start_date is not None and end_date is not None:
-        if start_date > end_date:
-            temp_start_date = start_date
-            start_date = end_date
-            end_date = temp_start_date
-            del temp_start_date
+    if start_date is not None and end_date is not None and start_date > end_date:
+        start_date, end_date = end_date, start_date
 
     if args.log is not None:
-        log_filename = Path(args.log).expanduser()
-        if log_filename.is_dir() or (not log_filename.exists() and log_filename.suffix == ''):
-            log_filename = log_filename / f'packetraven_log_{datetime.now():%Y%m%dT%H%M%S}.txt'
-        if not log_filename.parent.exists():
-            log_filename.parent.mkdir(parents=True, exist_ok=True)
+        log_filename = resolve_output_filename(args.log, 'packetraven_log', '.txt')
         get_logger(LOGGER.name, log_filename)
     else:
         log_filename = None
 
     if args.output is not None:
-        output_filename = Path(args.output).expanduser()
-        if output_filename.is_dir() or (
-            not output_filename.exists() and output_filename.suffix == ''
-        ):
-            output_filename = (
-                output_filename / f'packetraven_output_{datetime.now():%Y%m%dT%H%M%S}.geojson'
-            )
-        if not output_filename.parent.exists():
-            output_filename.parent.mkdir(parents=True, exist_ok=True)
+        output_filename = resolve_output_filename(
+            args.output, 'packetraven_output', '.geojson'
+        )
     else:
         output_filename = None
 
     if args.prediction_output is not None:
-        prediction_filename = Path(args.prediction_output).expanduser()
-        if prediction_filename.is_dir() or (
-            not prediction_filename.exists() and prediction_filename.suffix == ''
-        ):
-            prediction_filename = (
-                prediction_filename
-                / f'packetraven_predict_{datetime.now():%Y%m%dT%H%M%S}.geojson'
-            )
-        if not prediction_filename.parent.exists():
-            prediction_filename.parent.mkdir(parents=True, exist_ok=True)
+        prediction_filename = resolve_output_filename(
+            args.prediction_output, 'packetraven_predict', '.geojson'
+        )
 
         if args.prediction_ascent_rate is not None:
             kwargs['prediction_ascent_rate'] = float(args.prediction_ascent_rate)
@@ -207,13 +195,13 @@ def main():
     interval_seconds = args.interval if args.interval >= 1 else 1
 
     if CREDENTIALS_FILENAME.exists():
-        credentials = kwargs.copy()
+        credentials = {}
         for section in read_configuration(CREDENTIALS_FILENAME).values():
             credentials.update(section)
-        kwargs = {
-            key: value if key not in kwargs or kwargs[key] is None else kwargs[key]
-            for key, value in credentials.items()
-        }
+        # fill unset arguments from the credentials file in a single pass
+        for key, value in credentials.items():
+            if kwargs.get(key) is None:
+                kwargs[key] = value
 
     if using_gui:
         from packetraven.gui import PacketRavenGUI
@@ -247,38 +235,24 @@ def main():
                     LOGGER.warning(f'{error.__class__.__name__} - {error}')
 
         if 'aprs_fi_key' in kwargs:
-            aprs_fi_kwargs = {key: kwargs[key] for key in ['aprs_fi_key'] if key in kwargs}
             try:
-                aprs_api = APRSfi(callsigns=callsigns, api_key=aprs_fi_kwargs['aprs_fi_key'])
-                LOGGER.info(f'connected to {aprs_api.location}')
+                aprs_api = APRSfi(callsigns=callsigns, api_key=kwargs['aprs_fi_key'])
+                LOGGER.info(f'querying {aprs_api.location}')
                 connections.append(aprs_api)
             except ConnectionError as error:
                 LOGGER.warning(f'{error.__class__.__name__} - {error}')
 
         if 'database_hostname' in kwargs:
             database_kwargs = {
-                key: kwargs[key]
-                for key in [
-                    'database_hostname',
-                    'database_database',
-                    'database_table',
-                    'database_username',
-                    'database_password',
-                ]
-                if key in kwargs
+                key: kwargs[key] for key in DATABASE_CREDENTIALS if key in kwargs
             }
             ssh_tunnel_kwargs = {
-                key: kwargs[key]
-                for key in ['ssh_hostname', 'ssh_username', 'ssh_password']
-                if key in kwargs
+                key: kwargs[key] for key in SSH_TUNNEL_CREDENTIALS if key in kwargs
             }
 
             try:
                 if 'ssh_hostname' in ssh_tunnel_kwargs:
-                    if (
-                        'ssh_username' not in ssh_tunnel_kwargs
-                        or ssh_tunnel_kwargs['ssh_username'] is None
-                    ):
+                    if ssh_tunnel_kwargs.get('ssh_username') is None:
                         ssh_username = input(
                             f'enter username for SSH host "{ssh_tunnel_kwargs["ssh_hostname"]}": '
                         )
@@ -286,10 +260,7 @@ def main():
                             raise ConnectionError('missing SSH username')
                         ssh_tunnel_kwargs['ssh_username'] = ssh_username
 
-                    if (
-                        'ssh_password' not in ssh_tunnel_kwargs
-                        or ssh_tunnel_kwargs['ssh_password'] is None
-                    ):
+                    if ssh_tunnel_kwargs.get('ssh_password') is None:
                         ssh_password = getpass(
                             f'enter password for SSH user "{ssh_tunnel_kwargs["ssh_username"]}": '
                         )
@@ -297,10 +268,7 @@ def main():
                             raise ConnectionError('missing SSH password')
                         ssh_tunnel_kwargs['ssh_password'] = ssh_password
 
-                if (
-                    'database_username' not in database_kwargs
-                    or database_kwargs['database_username'] is None
-                ):
+                if database_kwargs.get('database_username') is None:
                     database_username = input(
                         f'enter username for database '
                         f'"{database_kwargs["database_hostname"]}/{database_kwargs["database_database"]}": '
@@ -309,10 +277,7 @@ def main():
                         raise ConnectionError('missing database username')
                     database_kwargs['database_username'] = database_username
 
-                if (
-                    'database_password' not in database_kwargs
-                    or database_kwargs['database_password'] is None
-                ):
+                if database_kwargs.get('database_password') is None:
                     database_password = getpass(
                         f'enter password for database user "{database_kwargs["database_username"]}": '
                     )
@@ -411,6 +376,27 @@ def main():
             sys.exit(0)
 
 
+def resolve_output_filename(filename: PathLike, prefix: str, suffix: str) -> Path:
+    """
+    Resolve the given path to a file, creating a timestamped filename if the path is a directory, and create its parent directory.
+
+    :param filename: path to file or directory
+    :param prefix: prefix of the generated filename
+    :param suffix: extension of the generated filename
+    :return: path to file
+    """
+
+    filename = Path(filename).expanduser()
+    try:
+        is_directory = S_ISDIR(filename.stat().st_mode)
+    except FileNotFoundError:
+        is_directory = filename.suffix == ''
+    if is_directory:
+        filename = filename / f'{prefix}_{datetime.now():%Y%m%dT%H%M%S}{suffix}'
+    filename.parent.mkdir(parents=True, exist_ok=True)
+    return filename
+
+
 def retrieve_packets(
     connections: [PacketSource],
     packet_tracks: [LocationPacketTrack],
@@ -1,11 +1,15 @@
 from abc import ABC, abstractmethod
 from datetime import timedelta
+from functools import lru_cache
+from time import monotonic
 
 import requests
 from serial.tools import list_ports
 
 from packetraven.packets import APRSPacket, LocationPacket
 
+SERIAL_PORTS_CACHE_SECONDS = 2
+
 
 class Connection(ABC):
     interval: timedelta = None
@@ -33,7 +37,31 @@ class NetworkConnection(Connection):
             return False
 
 
+class TimeIntervalError(Exception):
+    pass
+
+
 class PacketSource(Connection):
+    def __init__(self, location: str):
+        super().__init__(location)
+        self.__last_access_time = None
+
+    def _check_interval(self):
+        """
+        Record an access of this source, unless the minimum time interval has not yet passed since the previous access.
+
+        :raises TimeIntervalError: if the previous access was too recent
+        """
+
+        now = monotonic()
+        if self.__last_access_time is not None and self.interval is not None:
+            interval = timedelta(seconds=now - self.__last_access_time)
+            if interval < self.interval:
+                raise TimeIntervalError(
+                    f'interval {interval} less than minimum interval {self.interval}'
+                )
+        self.__last_access_time = now
+
     @property
     @abstractmethod
     def packets(self) -> [LocationPacket]:
@@ -99,7 +127,10 @@ def available_serial_ports() -> str:
     :return: port name
     """
 
-    for com_port in list_ports.comports():
-        yield com_port.device
-    else:
-        return None
+    # enumerating ports is slow, so only do it once per caching period
+    yield from _available_serial_ports(int(monotonic() // SERIAL_PORTS_CACHE_SECONDS))
+
+
+@lru_cache(maxsize=1)
+def _available_serial_ports(period: int) -> (str,):
+    return tuple(com_port.device for com_port in list_ports.comports())
@@ -1,38 +1,114 @@
 from datetime import datetime, timedelta
-from os import PathLike
+from os import PathLike, fstat
 from pathlib import Path
+from struct import pack
 from time import sleep
-from typing import Any, Sequence
-from urllib.parse import urlparse
+from typing import Any, Collection, Iterator, Sequence
 
 import aprslib
 from dateutil.parser import parse as parse_date
 import geojson
+from psycopg2 import Binary, OperationalError
+from psycopg2.extras import execute_values
 import requests
+from requests.adapters import HTTPAdapter
 from serial import Serial
 from shapely.geometry import Point
 from tablecrow import PostGresTable
+from tablecrow.tables.base import parse_record_values
 from tablecrow.utilities import split_hostname_port
+from urllib3.util.retry import Retry
 
-from packetraven.packets import APRSPacket, LocationPacket
+try:
+    from orjson import loads as parse_json
+except ImportError:
+    from json import loads as parse_json
+
+from packetraven.packets import APRSPacket, LocationPacket, transform_packets
 from packetraven.parsing import InvalidPacketError
 from packetraven.utilities import get_logger, read_configuration, repository_root
+# `TimeIntervalError` is re-exported for code that imports it from this module
 from .base import (
     APRSPacketSink,
     APRSPacketSource,
     NetworkConnection,
     PacketSink,
     PacketSource,
+    TimeIntervalError,
     next_open_serial_port,
 )
 
 LOGGER = get_logger('connection')
 
+# little-endian ISO well-known binary of a 3D point (byte order, geometry type, X, Y, Z)
+POINT_Z_WKB_FORMAT = '<BI3d'
+POINT_Z_WKB_TYPE = 1001
+
 CREDENTIALS_FILENAME = repository_root() / 'credentials.config'
 
+REMOTE_SCHEMES = frozenset(('http', 'https', 'ftp', 'sftp'))
+
+
+def is_remote_location(location: PathLike) -> bool:
+    """
+    Whether the given location is a URL with a remote scheme, without parsing local paths.
+
+    :param location: file path or URL
+    :return: whether the location is remote
+    """
+
+    location = str(location)
+    if '://' not in location:
+        return False
+    return location.split('://', 1)[0].lower() in REMOTE_SCHEMES
+
+
+def callsign_headers(callsigns: [str]) -> {bytes}:
+    """
+    Encode the given callsigns for comparison against the source field of raw APRS frames.
+
+    :param callsigns: list of callsigns
+    :return: set of encoded callsigns, or `None` if no callsigns were given
+    """
 
-class TimeIntervalError(Exception):
-    pass
+    if callsigns is None:
+        return None
+    return frozenset(callsign.encode() for callsign in callsigns)
+
+
+def parse_packet_time(packet_time: str) -> datetime:
+    """
+    Parse the given timestamp, only falling back to the generic date parser if it is not in ISO format (`YYYY-MM-DD HH:MM:SS`).
+
+    :param packet_time: timestamp string
+    :return: date and time
+    """
+
+    packet_time = packet_time.strip()
+    try:
+        return datetime.fromisoformat(packet_time)
+    except ValueError:
+        return parse_date(packet_time)
+
+
+def parse_geojson_time(packet_time: str) -> datetime:
+    """
+    Parse the given GeoJSON feature timestamp, reading the `YYYYMMDDHHMMSS` format written by this package directly.
+
+    :param packet_time: timestamp string
+    :return: date and time
+    """
+
+    if len(packet_time) == 14 and packet_time.isdigit():
+        return datetime(
+            int(packet_time[:4]),
+            int(packet_time[4:6]),
+            int(packet_time[6:8]),
+            int(packet_time[8:10]),
+            int(packet_time[10:12]),
+            int(packet_time[12:]),
+        )
+    return parse_packet_time(packet_time)
 
 
 class SerialTNC(APRSPacketSource):
@@ -52,28 +128,37 @@ class SerialTNC(APRSPacketSource):
         else:
             serial_port = serial_port.strip('"')
 
-        self.serial_connection = Serial(serial_port, baudrate=9600, timeout=1)
+        # reads are only ever sized to what is already waiting, so they should never block
+        self.serial_connection = Serial(serial_port, baudrate=9600, timeout=0)
         super().__init__(self.serial_connection.port, callsigns)
-        self.__last_access_time = None
+        self.__buffer = bytearray()
 
     @property
     def packets(self) -> [APRSPacket]:
-        if self.__last_access_time is not None and self.interval is not None:
-            interval = datetime.now() - self.__last_access_time
-            if interval < self.interval:
-                raise TimeIntervalError(
-                    f'interval {interval} less than minimum interval {self.interval}'
-                )
+        self._check_interval()
+        # drain whatever has arrived without blocking, keeping any partial frame for next time
+        waiting = self.serial_connection.in_waiting
+        while waiting > 0:
+            self.__buffer += self.serial_connection.read(waiting)
+            waiting = self.serial_connection.in_waiting
+        *lines, partial_line = self.__buffer.split(b'\n')
+        self.__buffer = partial_line
+
+        callsigns = callsign_headers(self.callsigns)
+        from_frame = APRSPacket.from_frame
+        location = self.location
         packets = []
-        for line in self.serial_connection.readlines():
+        for line in lines:
+            line = bytes(line.strip())
+            if len(line) == 0:
+                continue
+            # skip frames from other callsigns before parsing them
+            if callsigns is not None and line.split(b'>', 1)[0] not in callsigns:
+                continue
             try:
-                packet = APRSPacket.from_frame(line, source=self.location)
-                packets.append(packet)
+                packets.append(from_frame(line, source=location))
             except Exception as error:
                 LOGGER.error(f'{error.__class__.__name__} - {error}')
-        if self.callsigns is not None:
-            packets = [packet for packet in packets if packet.from_callsign in self.callsigns]
-        self.__last_access_time = datetime.now()
         return packets
 
     def close(self):
@@ -93,7 +178,7 @@ class RawAPRSTextFile(APRSPacketSource):
         :param callsigns: list of callsigns to return from source
         """
 
-        if not urlparse(str(filename)).scheme in ['http', 'https', 'ftp', 'sftp']:
+        if not is_remote_location(filename):
             if not isinstance(filename, Path):
                 if isinstance(filename, str):
                     filename = filename.strip('"')
@@ -101,51 +186,66 @@ class RawAPRSTextFile(APRSPacketSource):
             filename = str(filename)
 
         super().__init__(filename, callsigns)
-        self.__last_access_time = None
-        self.__parsed_lines = []
+        self.__file_position = 0
+        self.__file_size = None
+        # hashes rather than full lines, to bound the memory used by long-running remote logs
+        self.__parsed_line_hashes = set()
 
     @property
     def packets(self) -> [APRSPacket]:
-        if self.__last_access_time is not None and self.interval is not None:
-            interval = datetime.now() - self.__last_access_time
-            if interval < self.interval:
-                raise TimeIntervalError(
-                    f'interval {interval} less than minimum interval {self.interval}'
-                )
-
-        if Path(self.location).exists():
-            file_connection = open(Path(self.location).expanduser().resolve())
-            lines = file_connection.readlines()
+        self._check_interval()
+
+        local = Path(self.location).exists()
+        if local:
+            with open(Path(self.location).expanduser().resolve(), 'rb') as file_connection:
+                file_size = fstat(file_connection.fileno()).st_size
+                if file_size < self.__file_position:
+                    # the file was truncated or replaced, so read it from the start
+                    self.__file_position = 0
+                if file_size > self.__file_position:
+                    # only read bytes that were appended since the last access, up to the size measured above
+                    file_connection.seek(self.__file_position)
+                    data = file_connection.read(file_size - self.__file_position)
+                    if self.__file_size is not None and file_size != self.__file_size:
+                        # the file is still growing, so leave a line that may still be written for the next access
+                        complete_size = data.rfind(b'\n') + 1
+                    else:
+                        complete_size = len(data)
+                    lines = data[:complete_size].split(b'\n')
+                    self.__file_position += complete_size
+                else:
+                    lines = []
+            self.__file_size = file_size
         else:
-            file_connection = requests.get(self.location, stream=True)
-            lines = file_connection.iter_lines()
+            lines = requests.get(self.location).content.split(b'\n')
 
+        callsigns = callsign_headers(self.callsigns)
+        from_frame = APRSPacket.from_frame
+        location = self.location
         packets = []
         for line in lines:
+            line = line.strip()
             if len(line) > 0:
-                if isinstance(line, bytes):
-                    line = line.decode()
-                if line not in self.__parsed_lines:
-                    self.__parsed_lines.append(line)
-                    try:
-                        packet_time, raw_aprs = line.split(': ', 1)
-                        packet_time = parse_date(packet_time)
-                    except:
-                        raw_aprs = line
-                        packet_time = datetime.now()
-                    raw_aprs = raw_aprs.strip()
-                    try:
-                        packets.append(
-                            APRSPacket.from_frame(raw_aprs, packet_time, source=self.location)
-                        )
-                    except Exception as error:
-                        LOGGER.error(f'{error.__class__.__name__} - {error}')
-
-        file_connection.close()
-
-        if self.callsigns is not None:
-            packets = [packet for packet in packets if packet.from_callsign in self.callsigns]
-        self.__last_access_time = datetime.now()
+                if not local:
+                    # remote files are downloaded in full every time
+                    line_hash = hash(line)
+                    if line_hash in self.__parsed_line_hashes:
+                        continue
+                    self.__parsed_line_hashes.add(line_hash)
+                try:
+                    packet_time, raw_aprs = line.split(b': ', 1)
+                    packet_time = parse_packet_time(packet_time.decode())
+                except:
+                    raw_aprs = line
+                    packet_time = datetime.now()
+                raw_aprs = raw_aprs.strip()
+                # skip frames from other callsigns before parsing them
+                if callsigns is not None and raw_aprs.split(b'>', 1)[0] not in callsigns:
+                    continue
+                try:
+                    packets.append(from_frame(raw_aprs.decode(), packet_time, source=location))
+                except Exception as error:
+                    LOGGER.error(f'{error.__class__.__name__} - {error}')
 
         return packets
 
@@ -164,7 +264,7 @@ class PacketGeoJSON(PacketSource):
         :param filename: path to GeoJSON file
         """
 
-        if not urlparse(str(filename)).scheme in ['http', 'https', 'ftp', 'sftp']:
+        if not is_remote_location(filename):
             if not isinstance(filename, Path):
                 if isinstance(filename, str):
                     filename = filename.strip('"')
@@ -172,16 +272,10 @@ class PacketGeoJSON(PacketSource):
             filename = str(filename)
 
         super().__init__(filename)
-        self.__last_access_time = None
 
     @property
     def packets(self) -> [LocationPacket]:
-        if self.__last_access_time is not None and self.interval is not None:
-            interval = datetime.now() - self.__last_access_time
-            if interval < self.interval:
-                raise TimeIntervalError(
-                    f'interval {interval} less than minimum interval {self.interval}'
-                )
+        self._check_interval()
 
         if Path(self.location).exists():
             with open(Path(self.location).expanduser().resolve()) as file_connection:
@@ -194,7 +288,7 @@ class PacketGeoJSON(PacketSource):
         for feature in features['features']:
             if feature['geometry']['type'] == 'Point':
                 properties = feature['properties']
-                time = parse_date(properties['time'])
+                time = parse_geojson_time(properties['time'])
                 del properties['time']
 
                 if 'from' in properties:
@@ -220,8 +314,6 @@ class PacketGeoJSON(PacketSource):
 
                 packets.append(packet)
 
-        self.__last_access_time = datetime.now()
-
         return packets
 
     def close(self):
@@ -247,6 +339,16 @@ class APRSfi(APRSPacketSource, NetworkConnection):
             raise ConnectionError(f'queries to {url} require a list of callsigns')
         super().__init__(url, callsigns)
 
+        # reuse a single keep-alive connection across queries, retrying transient failures
+        self.__session = requests.Session()
+        self.__session.mount(
+            'https://',
+            HTTPAdapter(
+                pool_connections=1, pool_maxsize=1, max_retries=Retry(total=2, backoff_factor=0.3)
+            ),
+        )
+        self.__last_response_time = None
+
         if api_key is None or api_key == '':
             configuration = read_configuration(CREDENTIALS_FILENAME)
 
@@ -255,12 +357,22 @@ class APRSfi(APRSPacketSource, NetworkConnection):
             else:
                 raise ConnectionError(f'no APRS.fi API key specified')
 
-        if not self.connected:
-            raise ConnectionError(f'no network connection')
-
+        # the key is validated by the first query rather than by a separate request
         self.api_key = api_key
 
-        self.__last_access_time = None
+    @property
+    def connected(self) -> bool:
+        # a recent response is proof enough of a connection
+        if (
+            self.__last_response_time is not None
+            and datetime.now() - self.__last_response_time < self.interval
+        ):
+            return True
+        try:
+            self.__get(self.location, timeout=2)
+            return True
+        except ConnectionError:
+            return False
 
     @property
     def api_key(self) -> str:
@@ -268,51 +380,75 @@ class APRSfi(APRSPacketSource, NetworkConnection):
 
     @api_key.setter
     def api_key(self, api_key: str):
-        response = requests.get(
-            f'{self.location}?name=OH2TI&what=wx&apikey={api_key}&format=json'
-        ).json()
-        if response['result'] == 'fail':
-            raise ConnectionError(response['description'])
         self.__api_key = api_key
+        self.__api_key_rejected = False
+        self.__query_callsigns = None
 
     @property
     def packets(self) -> [APRSPacket]:
-        if self.__last_access_time is not None and self.interval is not None:
-            interval = datetime.now() - self.__last_access_time
-            if interval < self.interval:
-                raise TimeIntervalError(
-                    f'interval {interval} less than minimum interval {self.interval}'
-                )
+        return list(self.iter_packets())
 
-        query = {
-            'name': ','.join(self.callsigns),
-            'what': 'loc',
-            'apikey': self.api_key,
-            'format': 'json',
-            'timerange': int(timedelta(days=1) / timedelta(seconds=1)),
-            'tail': int(timedelta(days=1) / timedelta(seconds=1)),
-        }
+    def iter_packets(self) -> Iterator[APRSPacket]:
+        """
+        Query aprs.fi for the most recent packets, parsing each entry of the response only as it is iterated over.
 
-        query = '&'.join(f'{key}={value}' for key, value in query.items())
+        :return: iterator of APRS packets
+        """
 
-        response = requests.get(f'{self.location}?{query}').json()
-        if response['result'] != 'fail':
-            packets = []
-            for packet_candidate in response['entries']:
-                try:
-                    packet = APRSPacket.from_frame(packet_candidate, source=self.location)
-                    packets.append(packet)
-                except Exception as error:
-                    LOGGER.error(f'{error.__class__.__name__} - {error}')
-        else:
+        self._check_interval()
+
+        # do not keep querying with a key that aprs.fi already rejected
+        if self.__api_key_rejected:
+            return iter(())
+
+        # only rebuild the encoded query URL when the callsigns or API key change
+        callsigns = ','.join(self.callsigns)
+        if callsigns != self.__query_callsigns:
+            query = {
+                'name': callsigns,
+                'what': 'loc',
+                'apikey': self.api_key,
+                'format': 'json',
+                'timerange': int(timedelta(days=1) / timedelta(seconds=1)),
+                'tail': int(timedelta(days=1) / timedelta(seconds=1)),
+            }
+            self.__query_url = requests.Request('GET', self.location, params=query).prepare().url
+            self.__query_callsigns = callsigns
+
+        response = parse_json(self.__get(self.__query_url).content)
+
+        if response['result'] == 'fail':
+            if response['code'].startswith('apikey'):
+                self.__api_key_rejected = True
+                LOGGER.warning(
+                    f'{self.location} rejected the API key ("{response["code"]}: {response["description"]}"); '
+                    f'no further queries will be made until the key is changed'
+                )
+                return iter(())
             LOGGER.warning(f'query failure "{response["code"]}: {response["description"]}"')
-            packets = []
+            return iter(())
+        return self.__parse_entries(response['entries'])
 
-        self.__last_access_time = datetime.now()
-        return packets
+    def __parse_entries(self, entries: [{str: Any}]) -> Iterator[APRSPacket]:
+        from_frame = APRSPacket.from_frame
+        location = self.location
+        for entry in entries:
+            try:
+                yield from_frame(entry, source=location)
+            except Exception as error:
+                LOGGER.error(f'{error.__class__.__name__} - {error}')
 
     def close(self):
-        pass
+        self.__session.close()
+
+    def __get(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault('timeout', 5)
+        try:
+            response = self.__session.get(url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as error:
+            raise ConnectionError(f'no network connection to {self.location} ({error})')
+        self.__last_response_time = datetime.now()
+        return response
 
     def __repr__(self):
         return f'{self.__class__.__name__}({repr(self.callsigns)}, {repr("****")})'
@@ -344,40 +480,156 @@ class PacketDatabaseTable(PostGresTable, PacketSource, PacketSink):
         if not self.connected:
             raise ConnectionError(f'cannot connect to {self.location}')
 
-        self.__last_access_time = None
         self.__send_buffer = []
 
     @property
     def packets(self) -> [LocationPacket]:
-        if self.__last_access_time is not None and self.interval is not None:
-            interval = datetime.now() - self.__last_access_time
-            if interval < self.interval:
-                raise TimeIntervalError(
-                    f'interval {interval} less than minimum interval {self.interval}'
-                )
+        self._check_interval()
+        location_fields = ('time', 'x', 'y', 'z', 'source')
+        attribute_fields = [
+            field
+            for field in self.fields
+            if field not in location_fields and field not in self.geometry_fields
+        ]
         packets = [
-            LocationPacket(**{key: value for key, value in record.items() if key != 'point'})
-            for record in self.records
+            LocationPacket(
+                record['time'],
+                record['x'],
+                record['y'],
+                record['z'],
+                source=record['source'],
+                **{field: record[field] for field in attribute_fields},
+            )
+            for record in self.records_without_geometry()
         ]
-        self.__last_access_time = datetime.now()
         return packets
 
+    def records_without_geometry(self, where: {str: [Any]} = None) -> Iterator[{str: Any}]:
+        """
+        Iterate over records without selecting their geometry columns, which are redundant with the X, Y, and Z columns.
+
+        :param where: dictionary mapping fields to lists of accepted values
+        :return: iterator of records
+        """
+
+        if not self.connected:
+            raise ConnectionError(f'cannot connect to {self.location}')
+
+        fields = {
+            field: field_type
+            for field, field_type in self.fields.items()
+            if field not in self.geometry_fields
+        }
+        conditions = []
+        values = []
+        if where is not None:
+            for field, accepted_values in where.items():
+                conditions.append(f'{field} IN %s')
+                values.append(tuple(accepted_values))
+
+        statement = f'SELECT {", ".join(fields)} FROM {self.name}'
+        if len(conditions) > 0:
+            statement += f' WHERE {" AND ".join(conditions)}'
+
+        with self.connection as connection:
+            # a named cursor pages rows from the server, so only one page is held in memory at a time
+            with connection.cursor(name=f'{self.name}_records') as cursor:
+                cursor.itersize = 1000
+                cursor.execute(f'{statement};', values)
+                for row in cursor:
+                    yield parse_record_values(dict(zip(fields, row)), fields)
+        connection.close()
+
     def __getitem__(self, key: Any) -> LocationPacket:
         record = super().__getitem__(key)
         record = {key.replace('packet_', ''): value for key, value in record.items()}
         return LocationPacket(**record, crs=self.crs)
 
-    def __setitem__(self, time: datetime, packet: LocationPacket):
+    def __setitem__(self, key: Any, packet: LocationPacket):
         if packet.crs != self.crs:
             packet.transform_to(self.crs)
-        PostGresTable.__setitem__(self, time, self.__packet_record(packet))
+        record = self.__packet_record(packet)
+        if not isinstance(key, Sequence) or isinstance(key, str):
+            key = [key]
+        record.update(zip(self.primary_key, key))
+        self.__insert_records([record])
 
-    def insert(self, packets: [APRSPacket]):
-        for packet in packets:
-            if packet.crs != self.crs:
-                packet.transform_to(self.crs)
-        records = [self.__packet_record(packet) for packet in packets]
-        PostGresTable.insert(self, records)
+    def insert(self, packets: [LocationPacket]):
+        transform_packets(packets, self.crs)
+        self.__insert_records([self.__packet_record(packet) for packet in packets])
+
+    def __insert_records(self, records: [{str: Any}]):
+        if len(records) == 0:
+            return
+
+        if not self.connected:
+            raise ConnectionError(f'cannot connect to {self.location}')
+
+        fields_not_in_table = {field for record in records for field in record} - set(
+            self.fields
+        )
+        if len(fields_not_in_table) > 0:
+            LOGGER.warning(
+                f'records have {len(fields_not_in_table)} fields not in the local table'
+                f' that will not be inserted: {sorted(fields_not_in_table)}'
+            )
+
+        # only write the fields each record has, so that an upsert does not overwrite stored values with nulls
+        batches = {}
+        for record in records:
+            if not all(field in record for field in self.primary_key):
+                raise KeyError(
+                    f'one or more records does not contain primary key(s) "{self.primary_key}"'
+                )
+            fields = tuple(field for field in self.fields if field in record)
+            batches.setdefault(fields, []).append(record)
+
+        with self.connection as connection:
+            with connection.cursor() as cursor:
+                for fields, batch in batches.items():
+                    self.__upsert(cursor, fields, batch)
+        connection.close()
+
+    def __upsert(self, cursor, fields: (str,), records: [{str: Any}]):
+        geometry_fields = [field for field in fields if field in self.geometry_fields]
+        columns = [field for field in fields if field not in geometry_fields]
+        srid = self.crs.to_epsg()
+
+        # rows sharing a primary key cannot be upserted by the same statement
+        primary_key_indices = [columns.index(field) for field in self.primary_key]
+        rows = {}
+        for record in records:
+            row = []
+            for field in columns:
+                value = record[field]
+                if isinstance(value, Collection) and not isinstance(value, (str, list)):
+                    value = list(value)
+                row.append(value)
+            row.extend(record[field] for field in geometry_fields)
+            rows[tuple(row[index] for index in primary_key_indices)] = row
+
+        primary_key = ', '.join(self.primary_key)
+        updated_columns = [
+            field for field in (*columns, *geometry_fields) if field not in self.primary_key
+        ]
+        if len(updated_columns) > 0:
+            conflict_action = 'DO UPDATE SET ' + ', '.join(
+                f'{field} = EXCLUDED.{field}' for field in updated_columns
+            )
+        else:
+            conflict_action = 'DO NOTHING'
+        template = ', '.join(
+            ['%s'] * len(columns) + [f'ST_GeomFromWKB(%s, {srid})'] * len(geometry_fields)
+        )
+
+        execute_values(
+            cursor,
+            f'INSERT INTO {self.name} ({", ".join((*columns, *geometry_fields))}) '
+            f'VALUES %s ON CONFLICT ({primary_key}) {conflict_action};',
+            list(rows.values()),
+            template=f'({template})',
+            page_size=1000,
+        )
 
     def __contains__(self, packet: LocationPacket) -> bool:
         if isinstance(packet, LocationPacket):
@@ -385,35 +637,75 @@ class PacketDatabaseTable(PostGresTable, PacketSource, PacketSink):
         return PostGresTable.__contains__(self, packet)
 
     def send(self, packets: [LocationPacket]):
-        new_packets = [packet for packet in packets if packet not in self]
+        packets = list(packets)
         if len(self.__send_buffer) > 0:
-            new_packets.extend(self.__send_buffer)
+            packets.extend(self.__send_buffer)
             self.__send_buffer.clear()
-        if len(new_packets) > 0:
-            LOGGER.info(
-                f'sending {len(new_packets)} packet(s) to {self.location}: {new_packets}'
-            )
+        if len(packets) > 0:
             try:
-                self.insert(new_packets)
+                existing_packets = self.__existing_packet_indices(packets)
+                new_packets = [
+                    packet
+                    for index, packet in enumerate(packets)
+                    if index not in existing_packets
+                ]
+                if len(new_packets) > 0:
+                    LOGGER.info(
+                        f'sending {len(new_packets)} packet(s) to {self.location}: {new_packets}'
+                    )
+                    self.insert(new_packets)
             except ConnectionError as error:
                 LOGGER.info(
                     f'could not send packet(s) ({error}); reattempting on next iteration'
                 )
-                self.__send_buffer.extend(new_packets)
+                self.__send_buffer.extend(packets)
 
     def close(self):
         self.connection.close()
         if self.tunnel is not None:
             self.tunnel.stop()
 
+    def __existing_packet_indices(self, packets: [LocationPacket]) -> {int}:
+        """ indices of the given packets whose primary key is already in the table, looked up in a single query """
+
+        if len(packets) == 0:
+            return set()
+
+        primary_key = ', '.join(self.primary_key)
+        candidates = [
+            (index, *(packet[key.replace('packet_', '')] for key in self.primary_key))
+            for index, packet in enumerate(packets)
+        ]
+
+        if not self.connected:
+            raise ConnectionError(f'cannot connect to {self.location}')
+
+        try:
+            with self.connection as connection:
+                with connection.cursor() as cursor:
+                    rows = execute_values(
+                        cursor,
+                        f'SELECT candidate_index FROM (VALUES %s) AS candidates (candidate_index, {primary_key}) '
+                        f'INNER JOIN {self.name} USING ({primary_key});',
+                        candidates,
+                        page_size=1000,
+                        fetch=True,
+                    )
+            connection.close()
+        except OperationalError as error:
+            raise ConnectionError(f'{error.__class__.__name__} - {error}')
+
+        return {row[0] for row in rows}
+
     @staticmethod
     def __packet_record(packet: LocationPacket) -> {str: Any}:
+        x, y, z = packet.coordinates
         return {
             'time': packet.time,
-            'x': packet.coordinates[0],
-            'y': packet.coordinates[1],
-            'z': packet.coordinates[2],
-            'point': Point(*packet.coordinates),
+            'x': x,
+            'y': y,
+            'z': z,
+            'point': Binary(pack(POINT_Z_WKB_FORMAT, 1, POINT_Z_WKB_TYPE, x, y, z)),
             **{f'packet_{field}': value for field, value in packet.attributes.items()},
         }
 
@@ -464,38 +756,30 @@ class APRSDatabaseTable(PacketDatabaseTable, APRSPacketSource, APRSPacketSink):
         location = f'postgres://{self.hostname}:{self.port}/{self.database}/{self.name}'
         APRSPacketSource.__init__(self, location, callsigns)
         APRSPacketSink.__init__(self, location)
-        self.__last_access_time = None
 
     @property
     def packets(self) -> [APRSPacket]:
-        if self.__last_access_time is not None and self.interval is not None:
-            interval = datetime.now() - self.__last_access_time
-            if interval < self.interval:
-                raise TimeIntervalError(
-                    f'interval {interval} less than minimum interval {self.interval}'
-                )
+        self._check_interval()
+
+        # map table columns to packet arguments once, rather than per record
+        arguments = {}
+        for field in self.fields:
+            if field in self.geometry_fields:
+                continue
+            argument = field.replace('packet_', '') if field.startswith('packet_') else field
+            if argument in ('from', 'to'):
+                argument = f'{argument}_callsign'
+            arguments[field] = argument
 
         packets = []
-        for record in self.records:
-            record = {
-                field
-                if field in ['time', 'x', 'y', 'z']
-                else field.replace('packet_', ''): value
-                for field, value in record.items()
-                if field not in ['point']
-            }
-            record['from_callsign'] = record['from']
-            del record['from']
-            if 'to' in record:
-                record['to_callsign'] = record['to']
-                del record['to']
-            else:
-                record['to'] = None
+        where = {'packet_from': self.callsigns} if self.callsigns is not None else None
+        for record in self.records_without_geometry(where):
+            record = {argument: record.get(field) for field, argument in arguments.items()}
+            record.setdefault('to_callsign', None)
             if record['source'] is None:
                 record['source'] = self.location
             packets.append(APRSPacket(**record))
 
-        self.__last_access_time = datetime.now()
         return packets
 
     def __getitem__(self, key: (datetime, str)) -> APRSPacket:
@@ -536,18 +820,6 @@ class APRSDatabaseTable(PacketDatabaseTable, APRSPacketSource, APRSPacketSink):
         else:
             return self.records_where(None)
 
-    @staticmethod
-    def __packet_record(packet: LocationPacket) -> {str: Any}:
-        return {
-            'time': packet.time,
-            'callsign': packet.callsign,
-            'x': packet.coordinates[0],
-            'y': packet.coordinates[1],
-            'z': packet.coordinates[2],
-            'point': Point(*packet.coordinates),
-            **{f'packet_{field}': value for field, value in packet.attributes.items()},
-        }
-
 
 class APRSis(APRSPacketSink, APRSPacketSource, NetworkConnection):
     def __init__(self, callsigns: [str] = None, hostname: str = None):
@@ -584,29 +856,24 @@ class APRSis(APRSPacketSink, APRSPacketSource, NetworkConnection):
             packets.extend(self.__send_buffer)
             self.__send_buffer.clear()
 
-        callsigns = {packet.from_callsign for packet in packets}
-        packets = {
-            callsign: [packet for packet in packets if packet.from_callsign == callsign]
-            for callsign in callsigns
-        }
-
         if len(packets) > 0:
+            callsign = packets[0].from_callsign
             LOGGER.info(f'sending {len(packets)} packet(s) to {self.location}: {packets}')
-            for callsign, callsign_packets in packets.items():
+            frames = [packet.frame for packet in packets]
+            try:
+                aprs_is = aprslib.IS(
+                    callsign, aprslib.passcode(callsign), self.hostname, self.port
+                )
+                aprs_is.connect()
                 try:
-                    frames = [packet.frame for packet in callsign_packets]
-                    aprs_is = aprslib.IS(
-                        callsign, aprslib.passcode(callsign), self.hostname, self.port
-                    )
-                    aprs_is.connect()
-                    if len(frames) > 0:
-                        aprs_is.sendall(r'\rn'.join(frames))
+                    aprs_is.sendall('\r\n'.join(frames))
+                finally:
                     aprs_is.close()
-                except ConnectionError as error:
-                    LOGGER.info(
-                        f'could not send packet(s) ({error}); reattempting on next iteration'
-                    )
-                    self.__send_buffer.extend(packets)
+            except (ConnectionError, aprslib.exceptions.GenericError) as error:
+                LOGGER.info(
+                    f'could not send packet(s) ({error}); reattempting on next iteration'
+                )
+                self.__send_buffer.extend(packets)
 
     @property
     def packets(self) -> [APRSPacket]:
@@ -615,12 +882,13 @@ class APRSis(APRSPacketSink, APRSPacketSource, NetworkConnection):
                 f'cannot retrieve packets from APRS-IS with no callsigns specified'
             )
 
+        callsigns = frozenset(self.callsigns)
         packets = []
 
         def add_frames(frame: str):
             try:
                 packet = APRSPacket.from_frame(frame)
-                if packet.from_callsign in self.callsigns and packet not in packets:
+                if packet.from_callsign in callsigns and packet not in packets:
                     packets.append(packet)
             except InvalidPacketError:
                 pass
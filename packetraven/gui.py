@@ -23,6 +23,8 @@ from packetraven.tracks import LocationPacketTrack, PredictedTrajectory
 from packetraven.utilities import get_logger
 from packetraven.writer import write_packet_tracks
 
+CALLSIGN_SEPARATOR = re.compile(r',+ *| +')
+
 
 class PacketRavenGUI:
     def __init__(
@@ -312,7 +314,7 @@ class PacketRavenGUI:
         if len(callsigns) > 0:
             callsigns = [
                 callsign.strip().upper()
-                for callsign in re.split(',+\ *|\ +', callsigns.strip('"'))
+                for callsign in CALLSIGN_SEPARATOR.split(callsigns.strip('"'))
             ]
         else:
             callsigns = None
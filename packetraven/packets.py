@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, Union
 
 from dateutil.parser import parse as parse_date
@@ -9,6 +10,43 @@ from packetraven.parsing import InvalidPacketError, parse_raw_aprs
 
 DEFAULT_CRS = CRS.from_epsg(4326)
 
+# parsed APRS fields that are passed to the packet constructor explicitly, rather than as attributes
+APRS_LOCATION_FIELDS = frozenset(('from', 'to', 'longitude', 'latitude', 'altitude'))
+
+
+@lru_cache(maxsize=16)
+def crs_transformer(source: CRS, target: CRS) -> Transformer:
+    """
+    Transformer between the given coordinate reference systems, remembered since building one is expensive.
+
+    :param source: coordinate reference system to transform from
+    :param target: coordinate reference system to transform to
+    :return: transformer
+    """
+
+    return Transformer.from_crs(source, target, always_xy=True)
+
+
+def transform_packets(packets: ['LocationPacket'], crs: CRS):
+    """
+    Transform the given packets to the given coordinate reference system, with one call per source coordinate reference system.
+
+    :param packets: location packets
+    :param crs: coordinate reference system to transform to
+    """
+
+    packets_by_crs = {}
+    for packet in packets:
+        if packet.crs != crs:
+            packets_by_crs.setdefault(packet.crs, []).append(packet)
+
+    for source_crs, source_packets in packets_by_crs.items():
+        coordinates = numpy.stack([packet.coordinates for packet in source_packets], axis=1)
+        coordinates = numpy.stack(crs_transformer(source_crs, crs).transform(*coordinates), axis=1)
+        for packet, packet_coordinates in zip(source_packets, coordinates):
+            packet.coordinates = packet_coordinates
+            packet.crs = crs
+
 
 class LocationPacket:
     """ location packet encoding (x, y, z) and time """
@@ -51,8 +89,9 @@ class LocationPacket:
             return geodetic.line_length(coordinates[:, 0], coordinates[:, 1])
 
     def transform_to(self, crs: CRS):
-        transformer = Transformer.from_crs(self.crs, crs)
-        self.coordinates = transformer.transform(self.coordinates)
+        transformer = crs_transformer(self.crs, crs)
+        self.coordinates = numpy.array(transformer.transform(*self.coordinates))
+        self.crs = crs
 
     def __getitem__(self, field: str) -> Any:
         if field not in self:
@@ -69,6 +108,8 @@ class LocationPacket:
         return Distance.from_packets(self, other)
 
     def __eq__(self, other: 'LocationPacket') -> bool:
+        if other is self:
+            return True
         return numpy.allclose(self.coordinates, other.coordinates)
 
     def __gt__(self, other: 'LocationPacket') -> bool:
@@ -111,7 +152,7 @@ class Distance:
         """
 
         if packet_2.crs != packet_1.crs:
-            transformer = Transformer.from_crs(packet_2.crs, packet_1.crs)
+            transformer = crs_transformer(packet_2.crs, packet_1.crs)
             packet_2_coordinates = transformer.transform(*packet_2.coordinates)
         else:
             packet_2_coordinates = packet_2.coordinates
@@ -227,7 +268,7 @@ class APRSPacket(LocationPacket):
             **{
                 key: value
                 for key, value in parsed_packet.items()
-                if key not in ['from', 'to', 'longitude', 'latitude', 'altitude']
+                if key not in APRS_LOCATION_FIELDS
             },
             **kwargs,
         )
@@ -285,7 +326,7 @@ class APRSPacket(LocationPacket):
         return super().__contains__(field)
 
     def __iter__(self):
-        yield from self.attributes
+        return iter(self.attributes)
 
     def __eq__(self, other: 'APRSPacket') -> bool:
         return (
@@ -13,24 +13,10 @@ def parse_raw_aprs(raw_aprs: Union[str, dict]) -> dict:
     :return: dictionary of APRS fields
     """
 
-    if not isinstance(raw_aprs, dict):
-        try:
-            parsed_packet = aprslib.parse(raw_aprs)
-        except aprslib.ParseError as error:
-            raise InvalidPacketError(str(error))
+    if isinstance(raw_aprs, dict):
+        parsed_packet = parse_aprs_fi_entry(raw_aprs)
     else:
-        parsed_packet = {
-            'from': raw_aprs['srccall'],
-            'to': raw_aprs['dstcall'],
-            'path': raw_aprs['path'].split(','),
-            'timestamp': raw_aprs['time'],
-            'symbol': raw_aprs['symbol'][1:],
-            'symbol_table': raw_aprs['symbol'][0],
-            'latitude': float(raw_aprs['lat']),
-            'longitude': float(raw_aprs['lng']),
-            'altitude': float(raw_aprs['altitude']) if 'altitude' in raw_aprs else None,
-            'comment': raw_aprs['comment'] if 'comment' in raw_aprs else 'comment',
-        }
+        parsed_packet = parse_aprs_frame(raw_aprs)
 
     # parsed_packet = {'raw': str(raw_aprs)}
     #
@@ -71,6 +57,42 @@ class InvalidPacketError(Exception):
     pass
 
 
+def parse_aprs_fi_entry(entry: dict) -> dict:
+    """
+    Parse APRS fields from an entry of an aprs.fi API response.
+
+    :param entry: dictionary of aprs.fi location fields
+    :return: dictionary of APRS fields
+    """
+
+    return {
+        'from': entry['srccall'],
+        'to': entry['dstcall'],
+        'path': entry['path'].split(','),
+        'timestamp': entry['time'],
+        'symbol': entry['symbol'][1:],
+        'symbol_table': entry['symbol'][0],
+        'latitude': float(entry['lat']),
+        'longitude': float(entry['lng']),
+        'altitude': float(entry['altitude']) if 'altitude' in entry else None,
+        'comment': entry['comment'] if 'comment' in entry else 'comment',
+    }
+
+
+def parse_aprs_frame(frame: Union[str, bytes]) -> dict:
+    """
+    Parse APRS fields from a raw frame.
+
+    :param frame: raw APRS string
+    :return: dictionary of APRS fields
+    """
+
+    try:
+        return aprslib.parse(frame)
+    except aprslib.ParseError as error:
+        raise InvalidPacketError(str(error))
+
+
 def decompress_longitude(compressed_longitude: str) -> float:
     """
     Decode longitude string from APRS compressed format (shifted ASCII in base 91) to a float.
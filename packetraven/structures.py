@@ -34,6 +34,8 @@ class DoublyLinkedList:
         entry within doubly-linked list with three attributes: value, previous node, and next node
         """
 
+        __slots__ = ('value', 'previous_node', 'next_node')
+
         def __init__(self, value, previous_node, next_node):
             self.value = value
             self.previous_node = previous_node
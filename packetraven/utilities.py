@@ -1,4 +1,5 @@
 import configparser
+from functools import lru_cache
 import logging
 from os import PathLike
 from pathlib import Path
@@ -20,7 +21,21 @@ def repository_root(path: PathLike = None) -> Path:
         return repository_root(path.parent)
 
 
-def read_configuration(filename: PathLike) -> {str: str}:
+def read_configuration(filename: PathLike) -> {str: {str: str}}:
+    if not isinstance(filename, Path):
+        filename = Path(filename)
+    try:
+        status = filename.stat()
+    except FileNotFoundError:
+        return {}
+
+    # only re-parse the file if it has changed since it was last read
+    configuration = _read_configuration(filename, status.st_mtime_ns, status.st_size)
+    return {section_name: dict(section) for section_name, section in configuration.items()}
+
+
+@lru_cache(maxsize=32)
+def _read_configuration(filename: Path, modified_time: int, size: int) -> {str: {str: str}}:
     configuration_file = configparser.ConfigParser()
     configuration_file.read(filename)
     return {
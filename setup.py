@@ -105,6 +105,7 @@ setup(
     extras_require={
         'testing': ['flake8', 'pytest', 'pytest-cov', 'pytest-xdist', 'pytz'],
         'development': ['oitnb'],
+        'speedup': ['orjson'],
     },
     entry_points={'console_scripts': ['packetraven=packetraven.__main__:main']},
 )
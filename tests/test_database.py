@@ -2,6 +2,7 @@ from datetime import datetime
 from functools import partial
 import os
 
+import numpy
 import psycopg2
 import pytest
 from sshtunnel import SSHTunnelForwarder
@@ -142,3 +143,96 @@ def test_packet_database(connection):
         packets[packet_index] == input_packets[packet_index]
         for packet_index in range(len(packets))
     )
+
+
+def aprs_database_table(connection, table_name: str) -> APRSDatabaseTable:
+    with connection:
+        with connection.cursor() as cursor:
+            if database_has_table(cursor, table_name):
+                cursor.execute(f'DROP TABLE {table_name};')
+
+    return APRSDatabaseTable(
+        hostname=CREDENTIALS['database']['hostname'],
+        database=CREDENTIALS['database']['database'],
+        table=table_name,
+        username=CREDENTIALS['database']['username'],
+        password=CREDENTIALS['database']['password'],
+        ssh_hostname=CREDENTIALS['database']['ssh_hostname'],
+        ssh_username=CREDENTIALS['database']['ssh_username'],
+        ssh_password=CREDENTIALS['database']['ssh_password'],
+    )
+
+
+def test_packet_database_upsert(connection):
+    table_name = 'test_table_upsert'
+
+    packet_1 = APRSPacket.from_frame(
+        "W3EAX-13>APRS,N3KTX-10*,WIDE1,WIDE2-1,qAR,N3TJJ-11:!/:J..:sh'O   "
+        "/A=053614|!g|  /W3EAX,313,0,21'C,nearspace.umd.edu",
+        packet_time=datetime(2019, 2, 3, 14, 36, 16),
+    )
+    packet_2 = APRSPacket.from_frame(
+        'W3EAX-13>APRS,WIDE1-1,WIDE2-1,qAR,W4TTU:!/:JAe:tn8O   '
+        "/A=046255|!i|  /W3EAX,322,0,20'C,nearspace.umd.edu",
+        packet_time=datetime(2019, 2, 3, 14, 38, 23),
+    )
+
+    packet_table = aprs_database_table(connection, table_name)
+    packet_table.insert([packet_1, packet_2])
+    packet_table.insert([packet_1])
+
+    assert len(packet_table.packets) == 2
+    assert packet_1 == packet_table[packet_1.time, packet_1.from_callsign]
+
+    # a packet without a comment only updates the fields it has
+    packet_table[packet_1.time, packet_1.from_callsign] = APRSPacket(
+        packet_1.from_callsign, None, packet_1.time, *packet_2.coordinates
+    )
+    updated_packet = packet_table[packet_1.time, packet_1.from_callsign]
+
+    with connection:
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE {table_name};')
+
+    assert numpy.allclose(updated_packet.coordinates, packet_2.coordinates)
+    assert updated_packet['comment'] == packet_1['comment']
+    assert updated_packet['raw'] == packet_1['raw']
+
+
+def test_packet_database_send(connection):
+    table_name = 'test_table_send'
+
+    packet_1 = APRSPacket.from_frame(
+        "W3EAX-13>APRS,N3KTX-10*,WIDE1,WIDE2-1,qAR,N3TJJ-11:!/:J..:sh'O   "
+        "/A=053614|!g|  /W3EAX,313,0,21'C,nearspace.umd.edu",
+        packet_time=datetime(2019, 2, 3, 14, 36, 16),
+    )
+    packet_2 = APRSPacket.from_frame(
+        'W3EAX-13>APRS,WIDE1-1,WIDE2-1,qAR,W4TTU:!/:JAe:tn8O   '
+        "/A=046255|!i|  /W3EAX,322,0,20'C,nearspace.umd.edu",
+        packet_time=datetime(2019, 2, 3, 14, 38, 23),
+    )
+    packet_3 = APRSPacket.from_frame(
+        'W3EAX-13>APRS,KC3FIT-1,WIDE1*,WIDE2-1,qAR,KC3AWP-10:!/:JL2:u4wO   '
+        "/A=043080|!j|  /W3EAX,326,0,20'C,nearspace.umd.edu",
+        packet_time=datetime(2019, 2, 3, 14, 39, 28),
+    )
+
+    packet_table = aprs_database_table(connection, table_name)
+    packet_table.insert([packet_1])
+
+    # a packet with the same key as a stored packet should not be sent
+    resent_packet_1 = APRSPacket(
+        packet_1.from_callsign, None, packet_1.time, *packet_2.coordinates
+    )
+    packet_table.send([resent_packet_1, packet_2, packet_3])
+
+    packets = packet_table.packets
+    stored_packet_1 = packet_table[packet_1.time, packet_1.from_callsign]
+
+    with connection:
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE {table_name};')
+
+    assert sorted(packets) == [packet_1, packet_2, packet_3]
+    assert stored_packet_1 == packet_1
@@ -0,0 +1,91 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from packetraven import RawAPRSTextFile
+from packetraven.packets import APRSPacket
+from packetraven.utilities import repository_root
+
+REFERENCE_DIRECTORY = repository_root() / 'tests' / 'reference'
+
+
+def test_raw_aprs_text_file():
+    with TemporaryDirectory() as temporary_directory:
+        filename = Path(temporary_directory) / 'packets.txt'
+
+        reference_lines = (REFERENCE_DIRECTORY / 'test_output.txt').read_text().splitlines()
+        filename.write_text('\n'.join(reference_lines[:2]) + '\n')
+
+        text_file = RawAPRSTextFile(filename)
+
+        packets = text_file.packets
+
+        assert len(packets) == 2
+        assert all(type(packet) is APRSPacket for packet in packets)
+
+        assert len(text_file.packets) == 0
+
+        with open(filename, 'a') as output_file:
+            output_file.write(reference_lines[2] + '\n')
+
+        packets = text_file.packets
+
+        assert len(packets) == 1
+        assert packets[0].from_callsign == 'W3EAX-8'
+
+
+def test_raw_aprs_text_file_unterminated_line():
+    filename = REFERENCE_DIRECTORY / 'test_output.txt'
+
+    packets = RawAPRSTextFile(filename).packets
+
+    assert len(packets) == 3
+    assert packets[-1].from_callsign == 'W3EAX-8'
+
+
+def test_raw_aprs_text_file_partial_line():
+    with TemporaryDirectory() as temporary_directory:
+        filename = Path(temporary_directory) / 'packets.txt'
+
+        reference_lines = (REFERENCE_DIRECTORY / 'test_output.txt').read_text().splitlines()
+        filename.write_text(reference_lines[0] + '\n')
+
+        text_file = RawAPRSTextFile(filename)
+
+        assert len(text_file.packets) == 1
+
+        split_index = len(reference_lines[1]) // 2
+        with open(filename, 'a') as output_file:
+            output_file.write(reference_lines[1][:split_index])
+
+        assert len(text_file.packets) == 0
+
+        with open(filename, 'a') as output_file:
+            output_file.write(reference_lines[1][split_index:] + '\n')
+
+        packets = text_file.packets
+
+        assert len(packets) == 1
+        assert packets[0].from_callsign == 'W3EAX-8'
+        assert packets[0] == APRSPacket.from_frame(
+            reference_lines[1].split(': ', 1)[1], packets[0].time
+        )
+
+        # an unterminated last line is parsed once the file stops growing
+        with open(filename, 'a') as output_file:
+            output_file.write(reference_lines[2])
+
+        assert len(text_file.packets) == 0
+
+        packets = text_file.packets
+
+        assert len(packets) == 1
+        assert packets[0] == APRSPacket.from_frame(
+            reference_lines[2].split(': ', 1)[1], packets[0].time
+        )
+
+
+def test_raw_aprs_text_file_callsigns():
+    filename = REFERENCE_DIRECTORY / 'test_output.txt'
+
+    assert len(RawAPRSTextFile(filename, callsigns=['W3EAX-8']).packets) == 3
+    assert len(RawAPRSTextFile(filename, callsigns=['W3EAX-9']).packets) == 0